@@ -15,16 +15,18 @@ def load_config_map(config_path: Path) -> Dict[str, str]:
     if not config_path.exists():
         logger.warning(f"⚠️ Config file {config_path} not found; continuing with empty configuration")
         return {}
-    lines = (l.strip() for l in config_path.read_text().splitlines())
-    pairs = (l.split('=', 1) for l in lines if l and not l.startswith('#') and '=' in l)
     config_map = {}
-    for k, v in pairs:
-        k = k.strip()
-        if k:
-            # Remove inline comments
-            if '#' in v:
-                v = v.split('#')[0]
-            config_map[k] = v.strip()
+    with config_path.open('r') as f:
+        for raw in f:
+            line = raw.strip()
+            if not line or line.startswith('#'):
+                continue
+            k, sep, v = line.partition('=')
+            k = k.strip()
+            if sep and k:
+                # Remove inline comments
+                v, _, _ = v.partition('#')
+                config_map[k] = v.strip()
     return config_map
 
 
@@ -3,34 +3,66 @@ import os
 import re
 import logging
 import glob
+import functools
+import mmap
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 logger = logging.getLogger("configurer")
 
-def resolve_variables(text, config_vars=None):
+_CONFIG_JSON_PATH = Path(__file__).resolve().parent / 'configurer.json'
+
+@functools.lru_cache(maxsize=256)
+def _compile(pattern):
+    """Compile a replacement pattern once and share it across apps"""
+    return re.compile(pattern)
+
+_VAR_RE = re.compile(r'\$\{(\w+)\}')
+
+@functools.lru_cache(maxsize=1024)
+def _template_segments(text):
+    """Split text into alternating literal and variable name segments"""
+    return tuple(_VAR_RE.split(text))
+
+def build_variable_lookup(config_vars=None):
+    """Snapshot the environment overlaid with non-empty config values"""
+    lookup = dict(os.environ)
+    lookup.update((k, v) for k, v in (config_vars or {}).items() if v)
+    return lookup
+
+def resolve_variables(text, lookup):
     """Resolve ${VAR} placeholders in text"""
-    if not isinstance(text, str):
-        return text
+    if not isinstance(text, str) or '${' not in text:
+        return text, []
     
-    # Find all unresolved variables
+    # Odd segments are variable names; plain joins rebuild the string
+    segments = _template_segments(text)
+    parts = list(segments)
     unresolved_vars = []
-    def check_replacer(match):
-        var = match.group(1)
-        value = (config_vars or {}).get(var) or os.getenv(var)
+    for i in range(1, len(segments), 2):
+        var = segments[i]
+        value = lookup.get(var)
         if value is None:
             unresolved_vars.append(var)
-            return match.group(0)  # Keep original placeholder
-        return value
+        else:
+            parts[i] = value
     
-    result = re.sub(r'\$\{(\w+)\}', check_replacer, text)
-    return (None, unresolved_vars) if unresolved_vars else (result, [])
+    return (None, unresolved_vars) if unresolved_vars else (''.join(parts), [])
 
-def load_apps_config(config_vars):
-    """Load and process configuration from JSON file"""
-    json_path = Path(__file__).resolve().parent / 'configurer.json'
+@functools.lru_cache(maxsize=4)
+def _load_raw_config(json_path, mtime_ns):
+    """Parse the JSON configuration; cached until the file's mtime changes"""
     with open(json_path, 'r') as f:
-        apps_config = json.load(f)
+        return json.load(f)
 
+def load_apps_config(config_vars):
+    """Load and process configuration from JSON file"""
+    json_path = _CONFIG_JSON_PATH
+    mtime_ns = os.stat(json_path).st_mtime_ns
+    lookup = build_variable_lookup(config_vars)
+    # Only the parse is cached: paths are globbed and checked on every call
+    apps_config = _load_raw_config(json_path, mtime_ns)
     processed = {}
     for app, config in apps_config.items():
         logger.debug(f"Loading {app} configuration...")
@@ -43,24 +75,26 @@ def load_apps_config(config_vars):
             
             resolved_paths = []
             for path in raw_paths:
-                resolved, unresolved_vars = resolve_variables(path, config_vars)
+                resolved, unresolved_vars = resolve_variables(path, lookup)
                 if resolved is not None:  # Only add if variables were resolved
                     # Expand wildcards if present
                     if '*' in resolved or '?' in resolved:
                         expanded_paths = glob.glob(resolved, recursive=True)
                         resolved_paths.extend(expanded_paths)
-                    else:
+                    elif os.path.exists(resolved):
                         resolved_paths.append(resolved)
             
+            # Nothing installed here: skip before resolving any replacement
             if not resolved_paths:
                 continue
                 
-            # Process replacements
-            replacements = []
+            # Process replacements, partitioned by type once here rather than per file
+            text_replacements = []
+            hex_replacements = []
             for rep in file_config.get('replacements', []):
                 if isinstance(rep, dict):
-                    resolved_pattern, pattern_unresolved = resolve_variables(rep.get('pattern', ''), config_vars)
-                    resolved_value, value_unresolved = resolve_variables(rep.get('value', ''), config_vars)
+                    resolved_pattern, pattern_unresolved = resolve_variables(rep.get('pattern', ''), lookup)
+                    resolved_value, value_unresolved = resolve_variables(rep.get('value', ''), lookup)
                     
                     # Skip replacement if any variables are unresolved
                     all_unresolved = pattern_unresolved + value_unresolved
@@ -74,117 +108,249 @@ def load_apps_config(config_vars):
                         'pattern': resolved_pattern,
                         'value': resolved_value
                     }
-                    replacements.append(processed_rep)
+                    if processed_rep['type'] != 'hexadecimal':
+                        # Text replacements run on raw bytes, no decode/encode round-trip
+                        processed_rep['value_bytes'] = resolved_value.encode('utf-8')
+                        try:
+                            processed_rep['compiled'] = _compile(resolved_pattern.encode('utf-8'))
+                        except re.error as e:
+                            logger.warning(f"⚠️  Skipping {processed_rep['name']} - invalid pattern {resolved_pattern!r}: {e}")
+                            continue
+                        text_replacements.append(processed_rep)
+                    else:
+                        try:
+                            processed_rep.update(_prepare_hex_replacement(resolved_pattern, resolved_value))
+                        except (UnicodeEncodeError, ValueError) as e:
+                            logger.warning(f"⚠️  Skipping {processed_rep['name']} - invalid hexadecimal replacement: {e}")
+                            continue
+                        hex_replacements.append(processed_rep)
             
-            if replacements:
-                files.append({'paths': resolved_paths, 'replacements': replacements})
+            if text_replacements or hex_replacements:
+                files.append({
+                    'paths': resolved_paths,
+                    'text_replacements': text_replacements,
+                    'hex_replacements': hex_replacements,
+                })
         
         if files:
             processed[app] = {'files': files}
     
     return processed
 
-def apply_text_replacements(content, replacements):
+def apply_text_replacements(content, replacements, report=logger.info):
     """Apply text-based regex replacements"""
+    # One pass per rule, in config order: each rule sees the previous rule's output
     modified = False
     for rep in replacements:
-        pattern, value = rep['pattern'], rep['value']
-        if re.search(pattern, content):
-            content = re.sub(pattern, value, content)
-            logger.info(f"✅ {rep['name']} -> {value}")
+        new_content, count = rep['compiled'].subn(rep['value_bytes'], content)
+        if count:
+            content = new_content
+            report(f"✅ {rep['name']} -> {rep['value']} (×{count})")
             modified = True
     return content, modified
 
-def apply_hex_replacements(content, replacements):
+# Decimal digits in a wildcard value stand for the raw byte values 0-9
+_DIGIT_BYTES = {ord(str(d)): d for d in range(10)}
+
+def _prepare_hex_replacement(pattern, value):
+    """Precompute the byte forms a hexadecimal replacement searches for and writes"""
+    if not pattern:
+        raise ValueError("empty pattern")
+    if '?' not in pattern:
+        return {
+            'pattern_bytes': pattern.encode('ascii'),
+            'value_bytes': value.encode('ascii'),
+        }
+    # Wildcard pattern: prefix, one wildcard byte, suffix
+    prefix_bytes = pattern.partition('?')[0].encode('ascii')
+    suffix_bytes = pattern.rpartition('?')[2].encode('ascii')
+    return {
+        'prefix_bytes': prefix_bytes,
+        'suffix_bytes': suffix_bytes,
+        'pattern_len': len(prefix_bytes) + 1 + len(suffix_bytes),
+        # Convert value (handle decimal numbers)
+        'value_bytes': value.translate(_DIGIT_BYTES).encode('latin-1'),
+    }
+
+def _hex_keeps_size(rep):
+    """Whether a hexadecimal replacement leaves the file size unchanged"""
+    if 'prefix_bytes' in rep:
+        return len(rep['value_bytes']) == rep['pattern_len']
+    return len(rep['value_bytes']) == len(rep['pattern_bytes'])
+
+def _find_wildcard(content, prefix_bytes, suffix_bytes, pattern_len):
+    """Offset of the first prefix + one byte + suffix match, or -1"""
+    if not prefix_bytes:
+        # Nothing to anchor on before the wildcard: find the suffix and step back
+        j = content.find(suffix_bytes, 1)
+        return j - 1 if j > 0 else -1
+    
+    # Jump between prefix occurrences, then check the suffix in place
+    prefix_len = len(prefix_bytes)
+    last_start = len(content) - pattern_len
+    i = content.find(prefix_bytes)
+    while 0 <= i <= last_start:
+        if content[i + prefix_len + 1:i + pattern_len] == suffix_bytes:
+            return i
+        i = content.find(prefix_bytes, i + 1)
+    return -1
+
+def _hex_matches(content, rep):
+    """Whether a hexadecimal replacement's pattern occurs in content"""
+    if 'prefix_bytes' in rep:
+        return _find_wildcard(content, rep['prefix_bytes'], rep['suffix_bytes'], rep['pattern_len']) >= 0
+    return content.find(rep['pattern_bytes']) >= 0
+
+def apply_hex_replacements(content, replacements, report=logger.info):
     """Apply hexadecimal replacements for binary files"""
+    # Writable buffers (mmap, bytearray) get same-size replacements in place
+    in_place = not isinstance(content, bytes)
     modified = False
+    
+    # One pass per rule, in config order: each rule sees the previous rule's output
     for rep in replacements:
         pattern, value = rep['pattern'], rep['value']
         
-        # Convert ASCII pattern to hex bytes
         if '?' in pattern:
-            # Wildcard pattern - find and replace
-            prefix = pattern.split('?')[0]
-            suffix = pattern.split('?')[-1] if '?' in pattern else ''
-            
-            prefix_bytes = prefix.encode('ascii') if prefix else b''
-            suffix_bytes = suffix.encode('ascii') if suffix else b''
-            
-            # Simple search for pattern
-            pattern_len = len(prefix_bytes) + 1 + len(suffix_bytes)
-            for i in range(len(content) - pattern_len + 1):
-                if (content[i:i+len(prefix_bytes)] == prefix_bytes and 
-                    content[i+len(prefix_bytes)+1:i+len(prefix_bytes)+1+len(suffix_bytes)] == suffix_bytes):
-                    
-                    # Convert value (handle decimal numbers)
-                    value_bytes = b''
-                    for char in value:
-                        if char.isdigit():
-                            value_bytes += bytes([int(char)])
-                        else:
-                            value_bytes += char.encode('ascii')
-                    
-                    content = content[:i] + value_bytes + content[i + pattern_len:]
-                    logger.info(f"✅ {rep['name']} -> {value}")
-                    modified = True
-                    break
+            # Wildcard pattern, byte forms precomputed at load time
+            pattern_len, value_bytes = rep['pattern_len'], rep['value_bytes']
+            i = _find_wildcard(content, rep['prefix_bytes'], rep['suffix_bytes'], pattern_len)
+            if i >= 0:
+                if in_place and len(value_bytes) == pattern_len:
+                    content[i:i + pattern_len] = value_bytes
+                else:
+                    # Join segments straight from a view: one copy of the content
+                    with memoryview(content) as view:
+                        content = b''.join((view[:i], value_bytes, view[i + pattern_len:]))
+                    in_place = False
+                report(f"✅ {rep['name']} -> {value}")
+                modified = True
         else:
             # Exact pattern match
-            pattern_bytes = pattern.encode('ascii')
-            if pattern_bytes in content:
-                value_bytes = value.encode('ascii')
-                content = content.replace(pattern_bytes, value_bytes)
-                logger.info(f"✅ {rep['name']} -> {value}")
+            pattern_bytes, value_bytes = rep['pattern_bytes'], rep['value_bytes']
+            i = content.find(pattern_bytes)
+            if i >= 0:
+                if in_place and len(value_bytes) == len(pattern_bytes):
+                    while i >= 0:
+                        content[i:i + len(value_bytes)] = value_bytes
+                        i = content.find(pattern_bytes, i + len(value_bytes))
+                else:
+                    content = content.replace(pattern_bytes, value_bytes)
+                report(f"✅ {rep['name']} -> {value}")
                 modified = True
     
     return content, modified
 
-def modify_file(file_path, replacements):
-    """Modify a single file with given replacements"""
-    if not os.path.exists(file_path):
+def _read_bytearray(file_path, size):
+    """Read a whole file into a preallocated mutable buffer"""
+    data = bytearray(size)
+    with open(file_path, 'rb') as f:
+        del data[f.readinto(data):]
+    return data
+
+# Held while a file's buffered log lines are written out
+_LOG_LOCK = threading.Lock()
+
+def modify_file(file_path, text_reps, hex_reps):
+    """Modify a single file with given text and hexadecimal replacements"""
+    try:
+        st = os.stat(file_path)
+    except OSError:
         #logger.info(f"ℹ️  {file_path} does not exist")
         return
     
-    if not replacements:
+    if not text_reps and not hex_reps:
         return
     
-    logger.info(f"🤖 {file_path} found")
+    # Buffer this file's lines and log them together, so concurrent files don't interleave
+    messages = [f"🤖 {file_path} found"]
+    try:
+        _patch_file(file_path, st.st_size, text_reps, hex_reps, messages.append)
+    finally:
+        with _LOG_LOCK:
+            for message in messages:
+                logger.info(message)
 
-    # Separate by type
-    text_reps = [r for r in replacements if r.get('type') != 'hexadecimal']
-    hex_reps = [r for r in replacements if r.get('type') == 'hexadecimal']
-    
-    # Handle text files
+def _patch_file(file_path, size, text_reps, hex_reps, report):
+    """Apply replacements to an existing file, reporting each applied rule"""
+    if hex_reps and not text_reps:
+        if size == 0:
+            return
+        keeps_size = all(_hex_keeps_size(r) for r in hex_reps)
+        # Check read-only first, so a file with nothing to change is never opened for writing
+        with open(file_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                if not any(_hex_matches(content, r) for r in hex_reps):
+                    return
+                data = None if keeps_size else bytearray(content)
+        with open(file_path, 'r+b') as f:
+            if keeps_size:
+                # Same-size replacements are patched straight into the mapping
+                with mmap.mmap(f.fileno(), 0) as content:
+                    apply_hex_replacements(content, hex_reps, report)
+                return
+            # Size-changing rebuilds are written back through one handle
+            data, modified = apply_hex_replacements(data, hex_reps, report)
+            if modified:
+                f.write(data)
+                f.truncate()
+        return
+
+    # Text files are read once, run text then binary replacements, write once
+    data = _read_bytearray(file_path, size)
+    modified = False
     if text_reps:
-        with open(file_path, 'r') as f:
-            content = f.read()
-        
-        content, modified = apply_text_replacements(content, text_reps)
-        
+        # Normalize newlines like text mode would, so patterns never see '\r';
+        # the normalized copy is only kept if a text replacement rewrites the file
+        text = data
+        if b'\r' in text:
+            text = text.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+        text, modified = apply_text_replacements(text, text_reps, report)
         if modified:
-            with open(file_path, 'w') as f:
-                f.write(content)
-    
-    # Handle binary files
+            data = text
+            if os.linesep != '\n':
+                data = data.replace(b'\n', os.linesep.encode('ascii'))
     if hex_reps:
-        with open(file_path, 'rb') as f:
-            content = f.read()
-        
-        content, modified = apply_hex_replacements(content, hex_reps)
-        
-        if modified:
-            with open(file_path, 'wb') as f:
-                f.write(content)
+        # A bytearray lets same-size replacements overwrite in place
+        if not isinstance(data, bytearray):
+            data = bytearray(data)
+        data, hex_modified = apply_hex_replacements(data, hex_reps, report)
+        modified = modified or hex_modified
+    if modified:
+        Path(file_path).write_bytes(data)
+
+def _max_workers(config_vars):
+    """Number of files configured concurrently, overridable with GSK_MAX_WORKERS"""
+    default = min(32, (os.cpu_count() or 1) * 2)
+    raw = (config_vars or {}).get('GSK_MAX_WORKERS') or os.getenv('GSK_MAX_WORKERS')
+    if not raw:
+        return default
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        logger.warning(f"⚠️  Invalid GSK_MAX_WORKERS '{raw}', using {default}")
+        return default
 
 def run(config_vars):
     """Main configuration runner"""
     apps_config = load_apps_config(config_vars)
     
-    logger.info("🤖 Configuring apps...")
+    # One task per file, keyed on its resolved path so that aliases of it (symlinks,
+    # ${APPDATA} and C:/Users/.../AppData) share a single writer
+    tasks = {}
+    merged = set()
     for app_name, config in apps_config.items():
         for file_config in config.get('files', []):
-            paths = file_config.get('paths', [])
-            replacements = file_config.get('replacements', [])
-            
-            for path in paths:
-                modify_file(path, replacements)
+            for path in file_config['paths']:
+                key = os.path.normcase(os.path.realpath(path))
+                # An entry naming one file twice contributes its rules once
+                if (key, id(file_config)) in merged:
+                    continue
+                merged.add((key, id(file_config)))
+                _, text_reps, hex_reps = tasks.setdefault(key, (path, [], []))
+                text_reps.extend(file_config['text_replacements'])
+                hex_reps.extend(file_config['hex_replacements'])
+    
+    logger.info("🤖 Configuring apps...")
+    with ThreadPoolExecutor(max_workers=_max_workers(config_vars)) as executor:
+        list(executor.map(lambda task: modify_file(*task), tasks.values()))
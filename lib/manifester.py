@@ -1,10 +1,12 @@
 import os
+import copy
 import json
-import subprocess
 import difflib
 import logging
 import sys
 import platform
+import re
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger("manifester")
 
@@ -12,6 +14,7 @@ relative_path = True
 
 manifest_filename= "launch_manifest.json"
 manifests_filename= "manifests.json"
+manifest_cache_filename= ".manifest_cache.json"
 
 if sys.platform.startswith("linux") or sys.platform == "darwin":
     _machine = platform.machine().lower()
@@ -47,14 +50,8 @@ if sys.platform.startswith("win"):
 else:
     WIN_ARCH_GROUPS = []
 
-def run_find_exe(cmd):
-    try:
-        executables = subprocess.check_output(cmd, shell=True, text=True).splitlines()
-    except subprocess.CalledProcessError:
-        return None
-    if not executables:
-        return None
-    return executables
+# One alternation per group, matched against the lowercased name in a single scan
+WIN_ARCH_PATTERNS = [re.compile("|".join(map(re.escape, group))) for group in WIN_ARCH_GROUPS if group]
 
 def find_best(game_dir, files):
     if files is None:
@@ -63,70 +60,247 @@ def find_best(game_dir, files):
         return files[0]
 
     folder_base = os.path.basename(game_dir)
+    bases = [os.path.splitext(os.path.basename(file))[0] for file in files]
+
+    # An executable named after its folder wins outright, an exact-case name first
+    if folder_base in bases:
+        return files[bases.index(folder_base)]
+    folder_lc = folder_base.lower()
+    for file, file_base in zip(files, bases):
+        if file_base.lower() == folder_lc:
+            return file
+
     best_match = None
     highest_score = 0.0
+    matcher = difflib.SequenceMatcher(None, folder_base)
 
-    for file in files:
-        file_base = os.path.splitext(os.path.basename(file))[0]
-        score = difflib.SequenceMatcher(None, folder_base, file_base).ratio()
+    for file, file_base in zip(files, bases):
+        matcher.set_seq2(file_base)
+        # The quick ratios are upper bounds, skip the full match when they cannot win
+        if matcher.real_quick_ratio() <= highest_score or matcher.quick_ratio() <= highest_score:
+            continue
+        score = matcher.ratio()
         if score > highest_score:
             highest_score = score
             best_match = file
+            if score == 1.0:
+                break
 
     return best_match
 
-def _get_bin_posix(game_dir, maxdepth, arch_filter=""):
-    if arch_filter == "x86":
-        cmd = f"""find "{game_dir}" -maxdepth {maxdepth} -type f -executable | \
-            grep -E "\\.x86$" | grep -v "x86_64" """
+# e_machine values as named by file(1), which the arch filters were written against
+ELF_MACHINES = {3: "Intel 80386", 40: "ARM", 62: "x86-64", 183: "ARM aarch64"}
+EXCLUDED_DIRS = ("/java/", "/jre/", "/lib/")
+
+
+def _iter_executables(root, maxdepth, depth=1):
+    # Same files and order as `find root -maxdepth N -type f -executable`, with each file's depth
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if entry.is_file(follow_symlinks=False):
+                if os.access(entry.path, os.X_OK):
+                    yield entry.path, depth
+            elif depth < maxdepth and entry.is_dir(follow_symlinks=False):
+                yield from _iter_executables(entry.path, maxdepth, depth + 1)
+        except OSError:
+            continue
+
+
+# IMAGE_FILE_HEADER.Machine and Mach-O cputype values, also named as file(1) prints them
+PE_MACHINES = {0x14c: "Intel 80386", 0x1c4: "ARMv7 Thumb", 0x8664: "x86-64", 0xaa64: "Aarch64"}
+MACHO_CPUS = {7: "i386", 12: "arm", 0x01000007: "x86_64", 0x0100000c: "arm64"}
+MACHO_MAGICS = {
+    b"\xfe\xed\xfa\xce": ("big", ""),
+    b"\xce\xfa\xed\xfe": ("little", ""),
+    b"\xfe\xed\xfa\xcf": ("big", "64-bit "),
+    b"\xcf\xfa\xed\xfe": ("little", "64-bit "),
+}
+
+
+def _describe_pe(f, header):
+    # e_lfanew points at the PE signature, COFF header and optional header magic
+    if len(header) < 64:
+        return None
+    f.seek(int.from_bytes(header[60:64], "little"))
+    pe = f.read(26)
+    if len(pe) < 26 or pe[:4] != b"PE\0\0":
+        return "MS-DOS executable"
+    machine = int.from_bytes(pe[4:6], "little")
+    characteristics = int.from_bytes(pe[22:24], "little")
+    kind = "PE32+" if pe[24:26] == b"\x0b\x02" else "PE32"
+    dll = " (DLL)" if characteristics & 0x2000 else ""
+    return f"{kind} executable{dll} {PE_MACHINES.get(machine, '')}"
+
+
+def _describe_macho(header):
+    # mach_header: magic, cputype, cpusubtype, filetype (MH_EXECUTE is 2)
+    if len(header) < 16 or header[:4] not in MACHO_MAGICS:
+        return None
+    byteorder, bits = MACHO_MAGICS[header[:4]]
+    if int.from_bytes(header[12:16], byteorder) != 2:
+        return None
+    cpu = MACHO_CPUS.get(int.from_bytes(header[4:8], byteorder), "")
+    return f"Mach-O {bits}{cpu} executable"
+
+
+def _describe_fat(f, header):
+    # Universal binary: big-endian arch count, then (cputype, cpusubtype, offset, size, align)
+    # entries; Java class files share the magic but have a far larger second word
+    count = int.from_bytes(header[4:8], "big")
+    if not 0 < count < 20:
+        return None
+    f.seek(8)
+    table = f.read(20 * count)
+    slices = []
+    for i in range(0, len(table) - 19, 20):
+        f.seek(int.from_bytes(table[i + 8:i + 12], "big"))
+        slices.append(_describe_macho(f.read(16)))
+    if not any(slices):
+        return None
+    return "Mach-O universal binary with " + " ".join(f"[{s}]" for s in slices if s)
+
+
+def _elf_is_pie(f, header, byteorder, is64):
+    # file(1) calls an ET_DYN object a "pie executable" only if DT_FLAGS_1 has DF_1_PIE,
+    # otherwise a "shared object"; find it through the PT_DYNAMIC program header
+    if is64:
+        phoff, phentsize, phnum = header[32:40], header[54:56], header[56:58]
+        word, ph_offset, ph_filesz = 8, slice(8, 16), slice(32, 40)
     else:
-        cmd = f"""find "{game_dir}" -maxdepth {maxdepth} -type f -executable -exec file {{}} + | \
-            grep executable | grep "{arch_filter}"  | sed "s#:.*##" | \
-            grep -v "/java/" | grep -v "/jre/" | grep -v "/lib/" """
-    return find_best(game_dir, run_find_exe(cmd))
+        phoff, phentsize, phnum = header[28:32], header[42:44], header[44:46]
+        word, ph_offset, ph_filesz = 4, slice(4, 8), slice(16, 20)
+    phoff, phentsize, phnum = (int.from_bytes(v, byteorder) for v in (phoff, phentsize, phnum))
+    # Malformed headers: too small to hold the fields read below, or an implausible table
+    if phentsize < ph_filesz.stop or phentsize * phnum > 1 << 20:
+        return False
+    f.seek(phoff)
+    table = f.read(phentsize * phnum)
+    for i in range(0, len(table) - phentsize + 1, phentsize):
+        if int.from_bytes(table[i:i + 4], byteorder) != 2:  # PT_DYNAMIC
+            continue
+        f.seek(int.from_bytes(table[i + ph_offset.start:i + ph_offset.stop], byteorder))
+        dynamic = f.read(min(int.from_bytes(table[i + ph_filesz.start:i + ph_filesz.stop], byteorder), 1 << 20))
+        for j in range(0, len(dynamic) - 2 * word + 1, 2 * word):
+            tag = int.from_bytes(dynamic[j:j + word], byteorder)
+            if tag == 0:  # DT_NULL
+                break
+            if tag == 0x6ffffffb:  # DT_FLAGS_1
+                return bool(int.from_bytes(dynamic[j + word:j + 2 * word], byteorder) & 0x08000000)
+        return False
+    return False
+
+
+def _describe_elf(f, header):
+    # Ehdr is 52 bytes for ELFCLASS32, 64 for ELFCLASS64
+    if len(header) < 20 or len(header) < (64 if header[4] == 2 else 52):
+        return None
+    byteorder = "little" if header[5] == 1 else "big"
+    e_type = int.from_bytes(header[16:18], byteorder)
+    e_machine = int.from_bytes(header[18:20], byteorder)
+    machine = ELF_MACHINES.get(e_machine, '')
+    if e_type == 2:  # ET_EXEC
+        return f"ELF executable {machine}"
+    if e_type == 3 and _elf_is_pie(f, header, byteorder, header[4] == 2):  # ET_DYN
+        return f"ELF pie executable {machine}"
+    return None
 
 
-def _get_bin_windows(game_dir, maxdepth):
-    root_depth = game_dir.rstrip(os.sep).count(os.sep)
+def _describe_executable(path):
+    # Read just enough of the header to tell programs from other files
+    try:
+        with open(path, "rb") as f:
+            header = f.read(64)
+            if header[:2] == b"MZ":
+                return _describe_pe(f, header)
+            if header[:4] == b"\xca\xfe\xba\xbe":
+                return _describe_fat(f, header)
+            if header[:4] == b"\x7fELF":
+                return _describe_elf(f, header)
+    except OSError:
+        return None
+    if header[:2] == b"#!":
+        return "script executable"
+    if header[:4] in MACHO_MAGICS:
+        return _describe_macho(header)
+    return None
+
+
+def _scan_executables(game_dir, maxdepth):
+    # One walk and one header read per file, shared by every arch filter and depth
+    executables = []
+    for path, depth in _iter_executables(game_dir, maxdepth):
+        if any(excluded in path for excluded in EXCLUDED_DIRS):
+            description = None
+        else:
+            description = _describe_executable(path)
+        executables.append((path, depth, description))
+    return executables
+
+
+def _get_bin_posix(game_dir, maxdepth, arch_filter="", executables=None):
+    if executables is None:
+        executables = _scan_executables(game_dir, maxdepth)
     candidates = []
-    for dirpath, dirnames, filenames in os.walk(game_dir):
-        depth = dirpath.rstrip(os.sep).count(os.sep) - root_depth
-        if depth >= maxdepth:
-            dirnames[:] = []
-        for name in filenames:
-            if not name.lower().endswith(".exe"):
-                continue
-            full = os.path.join(dirpath, name)
-            candidates.append(full)
+    for path, depth, description in executables:
+        if depth > maxdepth:
+            continue
+        if arch_filter == "x86":
+            if path.endswith(".x86") and "x86_64" not in path:
+                candidates.append(path)
+            continue
+        if description and (arch_filter in description or arch_filter in path):
+            candidates.append(path)
+    return find_best(game_dir, candidates or None)
+
+
+def _iter_windows_exes(root, maxdepth, depth=0):
+    # Same order and depth bound as the os.walk it replaces: a folder's files, then its subfolders
+    subdirs = []
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                if not entry.is_dir():
+                    if entry.name.lower().endswith(".exe"):
+                        yield entry.path
+                elif depth < maxdepth and not entry.is_symlink():
+                    subdirs.append(entry.path)
+    except OSError:
+        return
+    for path in subdirs:
+        yield from _iter_windows_exes(path, maxdepth, depth + 1)
+
+def _get_bin_windows(game_dir, maxdepth):
+    candidates = list(_iter_windows_exes(game_dir, maxdepth))
     if not candidates:
         return None
 
-    for group in WIN_ARCH_GROUPS or [[]]:
-        if group:
-            group_candidates = []
-            for path in candidates:
-                base = os.path.basename(path).lower()
-                for token in group:
-                    if token in base:
-                        group_candidates.append(path)
-                        break
-            if group_candidates:
-                return find_best(game_dir, group_candidates)
+    lowered = [(path, os.path.basename(path).lower()) for path in candidates]
+    for pattern in WIN_ARCH_PATTERNS:
+        group_candidates = [path for path, base in lowered if pattern.search(base)]
+        if group_candidates:
+            return find_best(game_dir, group_candidates)
 
     return find_best(game_dir, candidates)
 
 
-def get_bin(game_dir, maxdepth, arch_filter=""):
+def get_bin(game_dir, maxdepth, arch_filter="", executables=None):
     if sys.platform.startswith("win"):
         return _get_bin_windows(game_dir, maxdepth)
-    return _get_bin_posix(game_dir, maxdepth, arch_filter)
+    return _get_bin_posix(game_dir, maxdepth, arch_filter, executables)
 
 
-def get_target(game_dir):
-    real_game_dir=get_real_first_path(game_dir)
+def get_target(game_dir, real_game_dir=None):
+    if real_game_dir is None:
+        real_game_dir = get_real_first_path(game_dir)
+    executables = None if sys.platform.startswith("win") else _scan_executables(real_game_dir, 3)
     for depth in range(1, 4):
         for arch in EXEC_FILTERS:
-            exe = get_bin(real_game_dir, depth, arch)
+            exe = get_bin(real_game_dir, depth, arch, executables)
             if exe is not None:
                 return exe
 
@@ -137,33 +311,53 @@ def format_path(full_path, base_path):
         return os.path.relpath(full_path, base_path)
     return full_path
 
+def format_target_paths(exe, base_path):
+    # The executable's folder follows from its relative path, one relpath per target
+    target = format_path(exe, base_path)
+    return target, os.path.dirname(target) or os.curdir
+
 def get_real_first_path(game_dir):
     game_dir = os.path.normpath(game_dir)
-    entries = [entry for entry in os.listdir(game_dir) if not entry.startswith('.') and entry != manifest_filename]
-
-    # Filter out directories and files
-    directories = [entry for entry in entries if os.path.isdir(os.path.join(game_dir, entry))]
-    files = [entry for entry in entries if os.path.isfile(os.path.join(game_dir, entry))]
-
-    if len(directories) == 1 and len(files) == 0:
-        return get_real_first_path(os.path.join(game_dir, directories[0]))
+    while True:
+        # DirEntry carries the file type from the directory listing, no stat per entry
+        directories = []
+        has_files = False
+        with os.scandir(game_dir) as it:
+            for entry in it:
+                if entry.name.startswith('.') or entry.name == manifest_filename:
+                    continue
+                if entry.is_dir():
+                    directories.append(entry.path)
+                elif entry.is_file():
+                    has_files = True
+                # A file or a second folder means this is the game's real root
+                if has_files or len(directories) > 1:
+                    break
+
+        if len(directories) == 1 and not has_files:
+            game_dir = directories[0]
+            continue
 
-    return game_dir
+        return game_dir
 
-def get_title(game_dir):
-    return os.path.basename(get_real_first_path(game_dir))
+def get_title(game_dir, real_game_dir=None):
+    if real_game_dir is None:
+        real_game_dir = get_real_first_path(game_dir)
+    return os.path.basename(real_game_dir)
 
 
 def write_manifest(manifest_path, manifest):
     try:
+        # Encode in one go and write once, json.dump issues a write per token
+        data = json.dumps(manifest, indent=4)
         with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=4)
+            f.write(data)
         logger.info(f"✅ {os.path.basename(os.path.dirname(manifest_path))} manifest created")
     except Exception as e:
         logger.error(f"❌ Error creating manifest in {os.path.basename(os.path.dirname(manifest_path))}: {str(e)}")
 
 
-def _os_tag():
+def _detect_os_tag():
     if sys.platform.startswith("linux"):
         return "linux"
     if sys.platform.startswith("win"):
@@ -173,7 +367,7 @@ def _os_tag():
     return "other"
 
 
-def _arch_tag():
+def _detect_arch_tag():
     m = platform.machine().lower()
     if "arm" in m or "aarch64" in m:
         return "arm64"
@@ -184,6 +378,19 @@ def _arch_tag():
     return "other"
 
 
+# The host never changes during a run, detect it once at import
+_OS_TAG = _detect_os_tag()
+_ARCH_TAG = _detect_arch_tag()
+
+
+def _os_tag():
+    return _OS_TAG
+
+
+def _arch_tag():
+    return _ARCH_TAG
+
+
 def _arch_from_filter(arch_filter, exe_path):
     f = (arch_filter or "").lower()
     if f in ("arm64", "aarch64"):
@@ -199,14 +406,14 @@ def _arch_from_filter(arch_filter, exe_path):
         return "x86_64"
     if "x86" in base or "32" in base:
         return "x86"
-    return _arch_tag()
+    return _ARCH_TAG
 
 
 def _pick_save_path(spec):
     if isinstance(spec, str):
         return spec
     if isinstance(spec, list):
-        os_tag = _os_tag()
+        os_tag = _OS_TAG
         same_os = [s for s in spec if (s.get("os") or "").lower() == os_tag]
         if not same_os:
             same_os = [s for s in spec if not (s.get("os") or "").strip() or (s.get("os") or "").lower() == "any"]
@@ -222,54 +429,59 @@ def _pick_target_entry(manifest):
     targets = manifest.get("targets") or []
     if not targets:
         return None
-    os_tag = _os_tag()
-    arch_tag = _arch_tag()
+    os_tag = _OS_TAG
+    arch_tag = _ARCH_TAG
+
+    # Lowercase each target's os/arch once for the whole filter cascade
+    decorated = [(t, (t.get("os") or "").lower(), (t.get("arch") or "").lower()) for t in targets]
 
-    same_os = [t for t in targets if (t.get("os") or "").lower() == os_tag]
+    same_os = [d for d in decorated if d[1] == os_tag]
     if not same_os:
-        same_os = [t for t in targets if not (t.get("os") or "").strip() or (t.get("os") or "").lower() == "any"]
-    pool = same_os or targets
+        same_os = [d for d in decorated if not d[1].strip() or d[1] == "any"]
+    pool = same_os or decorated
 
-    same_arch = [t for t in pool if (t.get("arch") or "").lower() == arch_tag]
+    same_arch = [d for d in pool if d[2] == arch_tag]
     if not same_arch:
-        same_arch = [t for t in pool if not (t.get("arch") or "").strip() or (t.get("arch") or "").lower() == "any"]
+        same_arch = [d for d in pool if not d[2].strip() or d[2] == "any"]
     pool = same_arch or pool
 
-    return pool[0]
+    return pool[0][0]
 
 
-def _collect_targets_for_manifest(game_dir):
-    os_tag = _os_tag()
-    real_game_dir = get_real_first_path(game_dir)
+def _collect_targets_for_manifest(game_dir, real_game_dir):
+    os_tag = _OS_TAG
     targets = []
 
     if sys.platform.startswith("win"):
-        exe = get_target(game_dir)
+        exe = get_target(game_dir, real_game_dir)
         if exe:
+            target, start_in = format_target_paths(exe, game_dir)
             targets.append(
                 {
                     "os": os_tag,
-                    "arch": _arch_tag(),
-                    "target": format_path(exe, game_dir),
-                    "startIn": format_path(os.path.dirname(exe), game_dir),
+                    "arch": _ARCH_TAG,
+                    "target": target,
+                    "startIn": start_in,
                     "launchOptions": "",
                 }
             )
         return targets
 
     seen = set()
+    executables = _scan_executables(real_game_dir, 3)
     for arch_filter in EXEC_FILTERS:
-        exe = get_bin(real_game_dir, 3, arch_filter)
+        exe = get_bin(real_game_dir, 3, arch_filter, executables)
         if not exe or exe in seen:
             continue
         seen.add(exe)
         arch = _arch_from_filter(arch_filter, exe)
+        target, start_in = format_target_paths(exe, game_dir)
         targets.append(
             {
                 "os": os_tag,
                 "arch": arch,
-                "target": format_path(exe, game_dir),
-                "startIn": format_path(os.path.dirname(exe), game_dir),
+                "target": target,
+                "startIn": start_in,
                 "launchOptions": "",
             }
         )
@@ -280,17 +492,19 @@ def createManifest(game_dir):
     manifest_path = os.path.join(game_dir, manifest_filename)
     if(os.path.exists(manifest_path)):
         return
-    targets = _collect_targets_for_manifest(game_dir)
+    # Unwrapping single-folder nesting walks the tree, do it once per game
+    real_game_dir = get_real_first_path(game_dir)
+    targets = _collect_targets_for_manifest(game_dir, real_game_dir)
     if not targets:
         logger.info(f"❌ {os.path.basename(game_dir)} no executable found")
         return None
     logger.info(f"✅ {os.path.basename(game_dir)} executable detected")
     manifest = {
-        "title": get_title(game_dir),
+        "title": get_title(game_dir, real_game_dir),
         "targets": targets,
         "savePath": [
             {
-                "os": _os_tag(),
+                "os": _OS_TAG,
                 "path": "",
             }
         ],
@@ -301,16 +515,34 @@ def createManifest(game_dir):
 
 def find_manifests(game_dir):
     manifests = []
-    for root, dirs, files in os.walk(game_dir):
-        if manifest_filename in files:
-            manifest_path = os.path.join(root, manifest_filename)
-            manifests.append(manifest_path)
+    # Explicit pre-order walk; DirEntry types come from the listing, no stat per entry
+    stack = [game_dir]
+    while stack:
+        root = stack.pop()
+        subdirs = []
+        has_manifest = False
+        try:
+            with os.scandir(root) as it:
+                for entry in it:
+                    if entry.name == manifest_filename:
+                        has_manifest = not entry.is_dir()
+                    elif not entry.name.startswith('.') and entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+        except OSError:
+            continue
+        if has_manifest:
+            manifests.append(os.path.join(root, manifest_filename))
+            # Below a game's manifest is game data, not more games
+            if root != game_dir:
+                continue
+        stack.extend(reversed(subdirs))
     return manifests
 
-def load_and_ajust_manifest(manifest_path):
+def load_and_ajust_manifest(manifest_path, manifest=None):
     subfolder = os.path.dirname(manifest_path)
-    with open(manifest_path, 'r') as f:
-        manifest = json.load(f)
+    if manifest is None:
+        with open(manifest_path, 'r') as f:
+            manifest = json.load(f)
 
     if 'targets' in manifest:
         entry = _pick_target_entry(manifest)
@@ -335,19 +567,62 @@ def load_and_ajust_manifest(manifest_path):
     manifest["savePath"] = _pick_save_path(save_spec)
     return manifest
 
+def _load_manifest_cache(cache_path):
+    try:
+        with open(cache_path, 'r') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def _save_manifest_cache(cache_path, cache):
+    data = json.dumps(cache, separators=(',', ':'))
+    try:
+        with open(cache_path, 'w') as f:
+            f.write(data)
+    except OSError as e:
+        logger.warning(f"⚠️ Could not write manifest cache {cache_path}: {e}")
+
+# path -> {'stamp', 'manifest'} for manifests already parsed by this process
+_PARSED_MANIFESTS = {}
+
+def read_manifest(manifest_path, cache=None, fresh=None):
+    # Parsed manifests are reused while the file's mtime and size are unchanged
+    st = os.stat(manifest_path)
+    stamp = [st.st_mtime_ns, st.st_size]
+    for known in (_PARSED_MANIFESTS, cache or {}):
+        cached = known.get(manifest_path)
+        if cached and cached.get('stamp') == stamp:
+            manifest = cached['manifest']
+            break
+    else:
+        with open(manifest_path, 'r') as f:
+            manifest = json.load(f)
+    record = {'stamp': stamp, 'manifest': manifest}
+    _PARSED_MANIFESTS[manifest_path] = record
+    if fresh is not None:
+        fresh[manifest_path] = record
+    return copy.deepcopy(manifest)
+
 def create_main_manifest(games_dir):
     manifests = find_manifests(games_dir)
+    cache_path = os.path.join(games_dir, manifest_cache_filename)
+    cache = _load_manifest_cache(cache_path)
+    fresh = {}
     main_manifest = []
     for manifest_path in manifests:
-        manifest = load_and_ajust_manifest(manifest_path)
+        manifest = load_and_ajust_manifest(manifest_path, read_manifest(manifest_path, cache, fresh))
         if not manifest:
             continue
         main_manifest.append(manifest)
         logger.info(f"✅ {manifest['title']}")
 
     main_manifest_path = os.path.join(games_dir, manifests_filename)
+    data = json.dumps(main_manifest, indent=4)
     with open(main_manifest_path, 'w') as f:
-        json.dump(main_manifest, f, indent=4)
+        f.write(data)
+    if fresh != cache:
+        _save_manifest_cache(cache_path, fresh)
 
     logger.info(f"✅ Manifests file created at: {main_manifest_path}")
 
@@ -359,9 +634,10 @@ def run(config: dict):
         return
 
     logger.info(f"🤖 looking for games in {games_dir}")
-    for item in os.listdir(games_dir):
-        item_path = os.path.join(games_dir, item)
-        if os.path.isdir(item_path):
-            createManifest(item_path)
+    with os.scandir(games_dir) as it:
+        game_dirs = [entry.path for entry in it if entry.is_dir()]
+    # Each game folder is scanned independently; overlap their filesystem I/O
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        list(executor.map(createManifest, game_dirs))
 
     create_main_manifest(games_dir)
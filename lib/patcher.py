@@ -6,12 +6,21 @@ import glob
 import zlib
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 logger = logging.getLogger("patcher")
 
 FLIPS_PATH = Path(__file__).resolve().parent.parent / 'bin' / 'flips'
 
+# linux/fs.h _IOW(0x94, 9, int): share the source's extents instead of copying bytes
+FICLONE = 0x40049409
+
 def load_games_locations():
     """Load game directory locations from JSON file"""
     json_path = Path(__file__).resolve().parent / 'games_locations.json'
@@ -42,25 +51,66 @@ def check_flips_availability():
         return str(FLIPS_PATH)
     
     # Then try system PATH
-    try:
-        result = subprocess.run(['which', 'flips'], capture_output=True, text=True)
-        if result.returncode == 0:
-            return 'flips'
-    except FileNotFoundError:
-        pass
+    if shutil.which('flips'):
+        return 'flips'
     
     return None
 
 
+CRC_CHUNK_SIZE = 1 << 16
+
+# path -> (st_mtime_ns, st_size, crc32), so a file is only hashed again once it changes
+_CRC_CACHE = {}
+
 def calculate_crc32(filename):
-    with open(filename, 'rb') as file:
-        return zlib.crc32(file.read()) & 0xFFFFFFFF
+    st = os.stat(filename)
+    cached = _CRC_CACHE.get(filename)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    crc = _compute_crc32(filename)
+    _CRC_CACHE[filename] = (st.st_mtime_ns, st.st_size, crc)
+    return crc
+
+def forget_crc32(filename):
+    """Drop a cached CRC32 after the file was rewritten (copies keep the source mtime)"""
+    _CRC_CACHE.pop(filename, None)
+
+def _compute_crc32(filename):
+    # Stream through one reusable buffer instead of holding the whole file in memory
+    crc = 0
+    buf = bytearray(CRC_CHUNK_SIZE)
+    view = memoryview(buf)
+    with open(filename, 'rb', buffering=0) as file:
+        while True:
+            n = file.readinto(buf)
+            if not n:
+                break
+            crc = zlib.crc32(view[:n], crc)
+    return crc & 0xFFFFFFFF
+
+def copy_file(source_file, target_file):
+    """Copy a file with its metadata, as a copy-on-write clone when the filesystem allows it"""
+    if fcntl is not None:
+        try:
+            with open(source_file, 'rb') as src, open(target_file, 'wb') as dst:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            shutil.copystat(source_file, target_file)
+            return
+        except OSError:
+            # Not btrfs/xfs, or across filesystems: fall back to a regular copy
+            pass
+    shutil.copy2(source_file, target_file)
 
 def get_game_dirs():
     game_locations = load_games_locations()
-    return [p for p in game_locations if os.path.exists(p)]
+    # Drop duplicate locations first (keeping order) so each one is stat'ed once
+    return [p for p in dict.fromkeys(game_locations) if os.path.exists(p)]
 
 def check_file_status(file_path, target_crc32, patched_crc32):
+    # Without expected checksums every file is ready, no need to hash it
+    if not target_crc32 and not patched_crc32:
+        return "ready"
+
     actual_crc32 = calculate_crc32(file_path)
     
     if patched_crc32 and actual_crc32 == int(patched_crc32, 16):
@@ -69,7 +119,7 @@ def check_file_status(file_path, target_crc32, patched_crc32):
     if not target_crc32 or actual_crc32 == int(target_crc32, 16):
         return "ready"
     
-    logger.warning(f"❌ CRC mismatch. Expected: {target_crc32}, Got: {actual_crc32:08X}")
+    logger.warning(f"❌ CRC mismatch for {file_path}. Expected: {target_crc32}, Got: {actual_crc32:08X}")
     return "mismatch"
 
 def apply_replacement(source_file, target_file):
@@ -88,9 +138,11 @@ def apply_replacement(source_file, target_file):
                 logger.error(f"❌ {target_file} backup exists but target file differ from patch")
                 return
     else:
-        shutil.copy2(target_file, backup_file)
+        copy_file(target_file, backup_file)
+        forget_crc32(backup_file)
     
-    shutil.copy2(source_file, target_file)
+    copy_file(source_file, target_file)
+    forget_crc32(target_file)
     logger.info(f"✅ {target_file} replaced")
 
 def patch_file_with_backup_check(patch_info, source_file, target_file, flips_cmd):
@@ -118,12 +170,19 @@ def patch_file_with_backup_check(patch_info, source_file, target_file, flips_cmd
                 logger.error(f"❌ {target_file} backup exists but target file differ from patch")
                 return
     else:
-        shutil.copy2(target_file, backup_file)
+        copy_file(target_file, backup_file)
+        forget_crc32(backup_file)
     
-    cmd = f"'{flips_cmd}' -a '{source_file}' '{target_file}' '{target_file}.patched'"
-    result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+    # Exec flips directly: no shell to start, no quoting to break on odd paths
+    cmd = [flips_cmd, '-a', source_file, target_file, f"{target_file}.patched"]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True)
+    except OSError as e:
+        logger.error(f"❌ Error patching {target_file}: {e}")
+        return
     if result.returncode == 0:
         os.replace(f"{target_file}.patched", target_file)
+        forget_crc32(target_file)
         logger.info(f"✅ {target_file} patched")
     else:
         logger.error(f"❌ Error patching {target_file}: {result.stderr}")
@@ -135,13 +194,15 @@ def apply_patch_to_file(patch_info, source_file, target_file, flips_cmd):
         patch_file_with_backup_check(patch_info, source_file, target_file, flips_cmd)
 
 
-def process_single_patch(patch_info, patch_folder, flips_cmd):
+def process_single_patch(patch_info, patch_folder, flips_cmd, game_dirs=None):
     source_file = os.path.join(patch_folder, patch_info['file'])
     if not os.path.exists(source_file):
         logger.error(f"❌ {source_file} does not exist")
         return
     
-    for games_folder in get_game_dirs():
+    if game_dirs is None:
+        game_dirs = get_game_dirs()
+    for games_folder in game_dirs:
         target_file = os.path.join(games_folder, patch_info['target'])
         if not os.path.exists(target_file):
             continue
@@ -157,6 +218,30 @@ def process_single_patch(patch_info, patch_folder, flips_cmd):
     
     logger.info(f"❌ {patch_info['target']} not found")
 
+def process_patch_group(patches, patch_folder, flips_cmd, game_dirs):
+    for patch in patches:
+        process_single_patch(patch, patch_folder, flips_cmd, game_dirs)
+
+def find_patch_dirs(patches_dir):
+    """Yield folders holding a patch.json, in pre-order, without a stat per entry"""
+    stack = [patches_dir]
+    while stack:
+        root = stack.pop()
+        subdirs = []
+        has_patch = False
+        try:
+            with os.scandir(root) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.name == 'patch.json' and not entry.is_dir():
+                        has_patch = True
+        except OSError:
+            continue
+        if has_patch:
+            yield root
+        stack.extend(reversed(subdirs))
+
 def run(config: dict):
     patches_dir = config.get('PATCHES_PATH')
     if not patches_dir or not os.path.isdir(patches_dir):
@@ -173,23 +258,26 @@ def run(config: dict):
 
     logger.info(f"🤖 Looking for patches in {patches_dir}")
     patch_count = 0
+    # Game locations are globbed and checked once, not once per patch
+    game_dirs = get_game_dirs()
     
-    for root, dirs, files in os.walk(patches_dir):
-        if 'patch.json' not in files:
-            continue
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+        for root in find_patch_dirs(patches_dir):
+            json_file = os.path.join(root, 'patch.json')
+            relative_path = os.path.relpath(root, patches_dir)
+            logger.info(f"📦 Processing {relative_path}")
             
-        json_file = os.path.join(root, 'patch.json')
-        relative_path = os.path.relpath(root, patches_dir)
-        logger.info(f"📦 Processing {relative_path}")
-        
-        with open(json_file, 'r') as f:
-            patches = json.load(f)
-        
-        patch_folder = os.path.dirname(json_file)
-        for patch in patches:
-            process_single_patch(patch, patch_folder, flips_cmd)
-        
-        patch_count += 1
+            with open(json_file, 'r') as f:
+                patches = json.load(f)
+            
+            patch_folder = os.path.dirname(json_file)
+            # Patches on different files run in parallel; those sharing a target keep their order
+            by_target = {}
+            for patch in patches:
+                by_target.setdefault(os.path.normpath(patch['target']), []).append(patch)
+            list(executor.map(lambda group: process_patch_group(group, patch_folder, flips_cmd, game_dirs), by_target.values()))
+            
+            patch_count += 1
     
     if patch_count == 0:
         logger.info("ℹ️  No patch.json files found")
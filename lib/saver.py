@@ -1,15 +1,19 @@
+import errno
+import functools
 import os
 import json
+import stat
 import logging
 import shutil
 import re
+from concurrent.futures import ThreadPoolExecutor
 
 from . import manifester
 
 logger = logging.getLogger("saver")
 
 
-WINDOWS_RESERVED_NAMES = {
+WINDOWS_RESERVED_NAMES = frozenset({
     "CON",
     "PRN",
     "AUX",
@@ -32,7 +36,7 @@ WINDOWS_RESERVED_NAMES = {
     "LPT7",
     "LPT8",
     "LPT9",
-}
+})
 
 
 def _resolve_base_path(path: str) -> str:
@@ -40,24 +44,38 @@ def _resolve_base_path(path: str) -> str:
     return os.path.abspath(path)
 
 
-def _resolve_save_path(save_path: str, manifest_path: str) -> str:
+# Pure for the lifetime of a run: the environment is not modified while syncing
+@functools.lru_cache(maxsize=2048)
+def _resolve_save_path(save_path: str, manifest_dir: str) -> str:
     if not save_path:
         return ""
     save_path = os.path.expandvars(os.path.expanduser(save_path))
     if not os.path.isabs(save_path):
-        manifest_dir = os.path.dirname(manifest_path)
         save_path = os.path.join(manifest_dir, save_path)
     return os.path.normpath(save_path)
 
 
+# Control characters and characters Windows forbids in file names become "_"
+_SANITIZE_TABLE = {i: "_" for i in range(32)}
+_SANITIZE_TABLE.update({ord(c): "_" for c in '<>:"/\\|?*'})
+_WHITESPACE_RE = re.compile(r"\s+")
+# Titles the full sanitizer would only change by turning single inner spaces into "_"
+_SAFE_TITLE_RE = re.compile(r"[A-Za-z0-9_-]+(?:[ .][A-Za-z0-9_-]+)*\Z")
+
+
 def _sanitize_title(title: str) -> str:
+    if (
+        title
+        and len(title) <= 100
+        and _SAFE_TITLE_RE.match(title)
+        and title.upper() not in WINDOWS_RESERVED_NAMES
+    ):
+        return title.replace(" ", "_")
     if not title:
         title = "game"
     name = title.strip()
-    name = "".join(
-        c if c not in '<>:"/\\|?*' and ord(c) >= 32 else "_" for c in name
-    )
-    name = re.sub(r"\s+", "_", name)
+    name = name.translate(_SANITIZE_TABLE)
+    name = _WHITESPACE_RE.sub("_", name)
     name = name.rstrip(". ")
     if not name:
         name = "game"
@@ -69,18 +87,33 @@ def _sanitize_title(title: str) -> str:
     return name
 
 
+def _iter_files(root: str, prefix: str = ""):
+    # Same files and order as os.walk: a folder's files first, symlinked folders not followed
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+    subdirs = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if is_dir:
+            if not entry.is_symlink():
+                subdirs.append(entry)
+        elif entry.name != SYNC_META_NAME:
+            yield os.path.join(prefix, entry.name) if prefix else entry.name, entry
+    for entry in subdirs:
+        yield from _iter_files(entry.path, os.path.join(prefix, entry.name) if prefix else entry.name)
+
+
 def _build_file_map(root: str) -> dict:
-    files = {}
+    # rel path -> os.DirEntry, whose cached stat() callers reuse
     if not os.path.isdir(root):
-        return files
-    for dirpath, dirnames, filenames in os.walk(root):
-        for fname in filenames:
-            if fname == SYNC_META_NAME:
-                continue
-            full = os.path.join(dirpath, fname)
-            rel = os.path.relpath(full, root)
-            files[rel] = full
-    return files
+        return {}
+    return dict(_iter_files(root))
 
 
 SYNC_META_NAME = ".gamer-sidekick"
@@ -90,7 +123,7 @@ def _max_mtime(files: dict) -> float:
     if not files:
         return 0.0
     try:
-        return max(os.path.getmtime(p) for p in files.values())
+        return max(entry.stat().st_mtime for entry in files.values())
     except OSError as e:
         logger.error(f"❌ Error computing directory mtime snapshot: {e}")
         return 0.0
@@ -113,86 +146,206 @@ def _write_sync_meta(root: str, snapshot_mtime: float) -> None:
     if not os.path.isdir(root):
         return
     meta_path = os.path.join(root, SYNC_META_NAME)
-    payload = {"last_snapshot_mtime": float(snapshot_mtime)}
+    data = json.dumps({"last_snapshot_mtime": float(snapshot_mtime)})
     try:
         with open(meta_path, "w") as f:
-            json.dump(payload, f)
+            f.write(data)
     except Exception as e:
         logger.error(f"❌ Error writing sync metadata {meta_path}: {e}")
 
 
-def _copy_file(src: str, dst: str) -> None:
-    os.makedirs(os.path.dirname(dst), exist_ok=True)
+# Errors meaning "copy_file_range can't do this pair", as opposed to a real I/O failure
+_COPY_RANGE_FALLBACK_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP, errno.EINVAL, errno.EPERM}
+
+
+def _copy_contents(src: str, dst: str, size: int) -> None:
+    # size is only a hint from the scan: the file may have changed since
+    if hasattr(os, "copy_file_range"):
+        try:
+            # In-kernel copy (a reflink on btrfs/xfs), no bytes through user space
+            src_fd = os.open(src, os.O_RDONLY)
+            try:
+                dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    # Copy until end of file, not just the scanned size, in case the file grew
+                    chunk = max(size, 1 << 20)
+                    copied = 0
+                    while True:
+                        n = os.copy_file_range(src_fd, dst_fd, chunk)
+                        if n == 0:
+                            break
+                        copied += n
+                    # Some filesystems report 0 instead of an error when they can't do it
+                    supported = copied > 0 or os.fstat(src_fd).st_size == 0
+                finally:
+                    os.close(dst_fd)
+            finally:
+                os.close(src_fd)
+            if supported:
+                return
+        except OSError as e:
+            if e.errno not in _COPY_RANGE_FALLBACK_ERRNOS:
+                raise
+    shutil.copyfile(src, dst)
+
+
+def _copy_with_metadata(src: os.DirEntry, dst: str) -> None:
+    # copy2 equivalent that reuses the entry's cached stat for mode and times
+    src_stat = src.stat()
+    _copy_contents(src.path, dst, src_stat.st_size)
+    os.chmod(dst, stat.S_IMODE(src_stat.st_mode))
+    os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+
+
+# Marks a destination that was not part of a scan, so it must be looked up on disk
+_NOT_SCANNED = object()
+
+
+def _copy_file(src: os.DirEntry, dst: str, dst_entry=_NOT_SCANNED, parent_exists: bool = False) -> bool:
+    # dst_entry is the destination's DirEntry from a scan of the target, or None if it had none.
+    # parent_exists skips the makedirs when the caller already created dst's folder.
+    if dst_entry is _NOT_SCANNED:
+        dst_exists = os.path.exists(dst)
+    else:
+        dst_exists = dst_entry is not None
+    if not dst_exists and not parent_exists:
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
     try:
-        if os.path.exists(dst):
+        if dst_exists:
             try:
-                src_stat = os.stat(src)
-                dst_stat = os.stat(dst)
+                src_stat = src.stat()
+                dst_stat = os.stat(dst) if dst_entry is _NOT_SCANNED else dst_entry.stat()
             except OSError:
                 # If we can't stat, fall back to copying
-                shutil.copy2(src, dst)
-                return
+                shutil.copy2(src.path, dst)
+                return True
 
             # If destination is at least as new and same size, treat as identical
             if (
                 src_stat.st_size == dst_stat.st_size
                 and src_stat.st_mtime <= dst_stat.st_mtime
             ):
-                return
+                return False
 
-        shutil.copy2(src, dst)
+        _copy_with_metadata(src, dst)
+        return True
     except Exception as e:
-        logger.error(f"❌ Error copying {src} -> {dst}: {e}")
+        logger.error(f"❌ Error copying {src.path} -> {dst}: {e}")
+        return False
+
+
+def _copy_files(files: dict, dst_root: str, dst_files=None) -> set:
+    # Small save files are latency bound; copying them concurrently overlaps the syscalls.
+    # With dst_files (a scan of dst_root) unchanged files are skipped on their cached stats.
+    tasks = [
+        (
+            src_entry,
+            os.path.join(dst_root, rel),
+            _NOT_SCANNED if dst_files is None else dst_files.get(rel),
+        )
+        for rel, src_entry in files.items()
+    ]
+    # Create each target folder once up front, rather than a makedirs per file
+    # (and racing ones from the workers)
+    created = set()
+    for folder in {os.path.dirname(dst_path) for _, dst_path, dst_entry in tasks if not isinstance(dst_entry, os.DirEntry)}:
+        try:
+            os.makedirs(folder, exist_ok=True)
+            created.add(folder)
+        except OSError:
+            pass  # _copy_file retries it and reports the error for each affected file
+    tasks = [task + (os.path.dirname(task[1]) in created,) for task in tasks]
+    if len(tasks) <= 1:
+        copied = [_copy_file(*task) for task in tasks]
+    else:
+        with ThreadPoolExecutor(max_workers=min(16, len(tasks))) as executor:
+            copied = list(executor.map(lambda task: _copy_file(*task), tasks))
+    # Folders that received a file, for the final directory flush
+    return {os.path.dirname(task[1]) for task, ok in zip(tasks, copied) if ok}
+
+
+def _remove_files(entries: list, kind: str) -> set:
+    # Unlinks block on metadata I/O; overlap them like the copies
+    def remove(entry):
+        try:
+            os.remove(entry.path)
+            return True
+        except OSError as e:
+            logger.error(f"❌ Error removing obsolete {kind} file {entry.path}: {e}")
+            return False
+
+    if len(entries) <= 1:
+        removed = [remove(entry) for entry in entries]
+    else:
+        with ThreadPoolExecutor(max_workers=min(16, len(entries))) as executor:
+            removed = list(executor.map(remove, entries))
+    return {os.path.dirname(entry.path) for entry, ok in zip(entries, removed) if ok}
+
+
+def _fsync_dirs(folders) -> None:
+    # Durability contract: copies are never fsync'ed one by one. Each folder whose entries
+    # changed is flushed once at the end of a game's run, so new and removed names persist.
+    if not hasattr(os, "O_DIRECTORY"):
+        return  # Windows cannot open directories for fsync
+    for folder in folders:
+        try:
+            fd = os.open(folder, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            continue
+        try:
+            os.fsync(fd)
+        except OSError as e:
+            logger.error(f"❌ Error flushing {folder}: {e}")
+        finally:
+            os.close(fd)
 
 
 def _copy_tree_one_way(src_root: str, dst_root: str) -> None:
     files = _build_file_map(src_root)
     if not files:
         return
-    for rel, src_path in files.items():
-        dst_path = os.path.join(dst_root, rel)
-        _copy_file(src_path, dst_path)
+    _fsync_dirs(_copy_files(files, dst_root))
 
 
 def _bisync_dirs(a_root: str, b_root: str) -> None:
     a_files = _build_file_map(a_root)
     b_files = _build_file_map(b_root)
 
-    all_rel = set(a_files) | set(b_files)
-    for rel in sorted(all_rel):
-        a_path = a_files.get(rel)
-        b_path = b_files.get(rel)
+    # Each path is reconciled on its own, so no ordering is needed
+    for rel in a_files.keys() | b_files.keys():
+        a_entry = a_files.get(rel)
+        b_entry = b_files.get(rel)
 
-        if a_path and not b_path:
-            _copy_file(a_path, os.path.join(b_root, rel))
+        if a_entry and not b_entry:
+            _copy_file(a_entry, os.path.join(b_root, rel))
             continue
-        if b_path and not a_path:
-            _copy_file(b_path, os.path.join(a_root, rel))
+        if b_entry and not a_entry:
+            _copy_file(b_entry, os.path.join(a_root, rel))
             continue
 
-        if not a_path or not b_path:
+        if not a_entry or not b_entry:
             continue
 
         try:
-            a_mtime = os.path.getmtime(a_path)
-            b_mtime = os.path.getmtime(b_path)
+            a_mtime = a_entry.stat().st_mtime
+            b_mtime = b_entry.stat().st_mtime
         except OSError as e:
             logger.error(f"❌ Error getting mtime for {rel}: {e}")
             continue
 
         if a_mtime > b_mtime + 1e-6:
-            _copy_file(a_path, b_path)
+            _copy_file(a_entry, b_entry.path)
         elif b_mtime > a_mtime + 1e-6:
-            _copy_file(b_path, a_path)
+            _copy_file(b_entry, a_entry.path)
 
 
-def _sync_one_manifest(manifest_path: str, saves_root: str, strategy: str) -> None:
+def _resolve_manifest_dirs(manifest_path: str, saves_root: str):
     try:
-        with open(manifest_path, "r") as f:
-            manifest = json.load(f)
+        # Shares the manifester's parse of this file when it is unchanged since
+        manifest = manifester.read_manifest(manifest_path)
     except Exception as e:
         logger.error(f"❌ Error reading manifest {manifest_path}: {e}")
-        return
+        return None
 
     title = manifest.get("title") or os.path.basename(os.path.dirname(manifest_path))
     raw_save = manifest.get("savePath", "")
@@ -203,15 +356,50 @@ def _sync_one_manifest(manifest_path: str, saves_root: str, strategy: str) -> No
             save_path = raw_save
     except Exception as e:
         logger.error(f"❌ {title}: error resolving savePath {raw_save!r}: {e}")
-        return
+        return None
 
     if not save_path:
         logger.info(f"ℹ️ {title}: no savePath defined, skipping")
-        return
+        return None
 
-    src_dir = _resolve_save_path(save_path, manifest_path)
+    src_dir = _resolve_save_path(save_path, os.path.dirname(manifest_path))
     dst_dir = os.path.join(saves_root, _sanitize_title(title))
+    return title, src_dir, dst_dir
 
+
+def _sync_one_manifest(manifest_path: str, saves_root: str, strategy: str) -> None:
+    resolved = _resolve_manifest_dirs(manifest_path, saves_root)
+    if resolved is not None:
+        _sync_dirs(*resolved, strategy)
+
+
+def _group_by_shared_dirs(jobs: list) -> list:
+    # Jobs touching a common folder (same title, shared savePath) must not run concurrently
+    groups = []
+    owner = {}
+    for job in jobs:
+        _, src_dir, dst_dir = job
+        merged = None
+        for d in (src_dir, dst_dir):
+            group = owner.get(d)
+            if group is None or group is merged:
+                continue
+            if merged is None:
+                merged = group
+            else:
+                merged.extend(group)
+                for other in group:
+                    owner[other[1]] = owner[other[2]] = merged
+                groups.remove(group)
+        if merged is None:
+            merged = []
+            groups.append(merged)
+        merged.append(job)
+        owner[src_dir] = owner[dst_dir] = merged
+    return groups
+
+
+def _sync_dirs(title: str, src_dir: str, dst_dir: str, strategy: str) -> None:
     if strategy == "backup":
         if not os.path.isdir(src_dir):
             logger.info(f"ℹ️ {title}: source save directory {src_dir} not found, skipping backup")
@@ -226,17 +414,12 @@ def _sync_one_manifest(manifest_path: str, saves_root: str, strategy: str) -> No
         logger.info(f"🤖 Backing up saves for {title}")
 
         # Copy/update files from source into backup
-        for rel, src_path in src_files.items():
-            dst_path = os.path.join(dst_dir, rel)
-            _copy_file(src_path, dst_path)
+        touched = _copy_files(src_files, dst_dir, dst_files)
 
         # Remove files from backup that no longer exist in source
-        for rel, dst_path in dst_files.items():
-            if rel not in src_files:
-                try:
-                    os.remove(dst_path)
-                except OSError as e:
-                    logger.error(f"❌ Error removing obsolete backup file {dst_path}: {e}")
+        obsolete = [entry for rel, entry in dst_files.items() if rel not in src_files]
+        touched |= _remove_files(obsolete, "backup")
+        _fsync_dirs(touched)
 
         logger.info(f"✅ {title}: backup updated")
         return
@@ -305,37 +488,32 @@ def _sync_one_manifest(manifest_path: str, saves_root: str, strategy: str) -> No
             return
         os.makedirs(dst_dir, exist_ok=True)
         source_root, target_root = src_dir, dst_dir
+        source_files, target_files = src_files, dst_files
+        source_snapshot = src_current
     else:
         if not dst_exists:
             logger.info(f"ℹ️ {title}: backup directory {dst_dir} does not exist, skipping sync")
             return
         os.makedirs(src_dir, exist_ok=True)
         source_root, target_root = dst_dir, src_dir
-
-    source_files = _build_file_map(source_root)
-    target_files = _build_file_map(target_root) if os.path.isdir(target_root) else {}
+        source_files, target_files = dst_files, src_files
+        source_snapshot = dst_current
 
     direction_label = "original -> backup" if direction == "src_to_dst" else "backup -> original"
     logger.info(f"🤖 Syncing saves for {title}: {direction_label}")
 
     # Copy/update files from source into target
-    for rel, src_path in source_files.items():
-        dst_path = os.path.join(target_root, rel)
-        _copy_file(src_path, dst_path)
+    touched = _copy_files(source_files, target_root, target_files)
 
     # Remove files from target that no longer exist in source
-    for rel, dst_path in target_files.items():
-        if rel not in source_files:
-            try:
-                os.remove(dst_path)
-            except OSError as e:
-                logger.error(f"❌ Error removing obsolete synced file {dst_path}: {e}")
+    obsolete = [entry for rel, entry in target_files.items() if rel not in source_files]
+    touched |= _remove_files(obsolete, "synced")
+    _fsync_dirs(touched)
 
-    # Update metadata snapshots on both sides
-    src_snapshot = _max_mtime(_build_file_map(src_dir) if os.path.isdir(src_dir) else {})
-    dst_snapshot = _max_mtime(_build_file_map(dst_dir) if os.path.isdir(dst_dir) else {})
-    _write_sync_meta(src_dir, src_snapshot)
-    _write_sync_meta(dst_dir, dst_snapshot)
+    # Update metadata snapshots on both sides; the source was only read, so its scan still holds
+    target_snapshot = _max_mtime(_build_file_map(target_root))
+    _write_sync_meta(source_root, source_snapshot)
+    _write_sync_meta(target_root, target_snapshot)
 
     logger.info(f"✅ {title}: saves synchronized (strategy=sync)")
 
@@ -370,5 +548,15 @@ def run(config: dict) -> None:
         return
 
     logger.info(f"🤖 Running saver with strategy='{strategy}' to {saves_root}")
-    for manifest_path in manifests:
-        _sync_one_manifest(manifest_path, saves_root, strategy)
+    jobs = [job for job in (_resolve_manifest_dirs(m, saves_root) for m in manifests) if job]
+    if not jobs:
+        return
+
+    def sync_group(group):
+        for title, src_dir, dst_dir in group:
+            _sync_dirs(title, src_dir, dst_dir, strategy)
+
+    # Games save to independent folders, so their copies can overlap
+    groups = _group_by_shared_dirs(jobs)
+    with ThreadPoolExecutor(max_workers=min(8, len(groups))) as executor:
+        list(executor.map(sync_group, groups))